@@ -2,45 +2,92 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import pathlib
 import re
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from urllib.parse import urlparse, urlunparse
 
 from .parser import Article
-from .text_utils import keyword_similarity, normalize_title
+from .text_utils import (
+    bitmask_similarity,
+    keyword_bitmask,
+    keyword_similarity,
+    normalize_title,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:  # pragma: no cover - rapidfuzz is in requirements.txt
+    _rf_fuzz = _rf_process = None
 
 logger = logging.getLogger(__name__)
 
+# Minimum fuzzy ratio (0-1) for two normalized titles to count as duplicates
+TITLE_SIM_THRESHOLD = 0.85
+
+# Minimum word-shingle Jaccard for a seen title to be worth a full comparison
+SHINGLE_GATE_THRESHOLD = 0.3
+
+
+def _shingles(norm_title: str) -> frozenset[str]:
+    """Word shingles of a normalized title, used as a cheap dedup prefilter."""
+    return frozenset(norm_title.split())
+
+
+def _shingle_gate(a: frozenset[str], b: frozenset[str]) -> bool:
+    """Cheap Jaccard check that rules out clearly unrelated title pairs."""
+    if not a or not b:
+        return False
+    inter = len(a & b)
+    return inter > 0 and inter / (len(a) + len(b) - inter) >= SHINGLE_GATE_THRESHOLD
+
 DEFAULT_DB_PATH = pathlib.Path(__file__).resolve().parent.parent / "data" / "seen_articles.json"
 
 # UTM and tracking parameters to strip
-TRACKING_PARAMS = {
+TRACKING_PARAMS = frozenset({
     "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
     "ref", "source", "fbclid", "gclid", "mc_cid", "mc_eid",
-}
+})
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_url(url: str) -> str:
-    """Normalize a URL for dedup comparison."""
+    """Normalize a URL for dedup comparison.
+
+    Pure function of the input string, so results are memoized — the same
+    URLs recur across filter_new, the weekly buffer and multi-day runs.
+    """
     parsed = urlparse(url)
     # Remove www prefix
     host = parsed.hostname or ""
     if host.startswith("www."):
         host = host[4:]
-    # Remove tracking parameters
-    params = parse_qs(parsed.query, keep_blank_values=False)
-    filtered = {k: v for k, v in params.items() if k.lower() not in TRACKING_PARAMS}
-    clean_query = urlencode(filtered, doseq=True)
+    # Remove tracking parameters. Works on the raw key=value pairs in a
+    # single pass — no percent-decode/re-encode round-trip needed just to
+    # drop keys. Blank values are dropped, matching the old parse_qs
+    # behaviour with keep_blank_values=False.
+    kept: list[str] = []
+    if parsed.query:
+        for pair in parsed.query.split("&"):
+            key, sep, value = pair.partition("=")
+            if sep and value and key.lower() not in TRACKING_PARAMS:
+                kept.append(pair)
+    clean_query = "&".join(kept)
     # Remove trailing slash
     path = parsed.path.rstrip("/")
     return urlunparse(("", host, path, "", clean_query, ""))
 
 
-def _titles_similar(a: str, b: str, threshold: float = 0.85) -> bool:
+def _titles_similar(a: str, b: str, threshold: float = TITLE_SIM_THRESHOLD) -> bool:
     """Check if two titles are similar enough to be duplicates.
 
     Uses two complementary strategies:
@@ -50,9 +97,19 @@ def _titles_similar(a: str, b: str, threshold: float = 0.85) -> bool:
     norm_a = normalize_title(a)
     norm_b = normalize_title(b)
 
-    # Strategy 1: sequence similarity on normalized titles
-    if SequenceMatcher(None, norm_a, norm_b).ratio() >= threshold:
-        return True
+    # Strategy 1: sequence similarity on normalized titles.
+    # ratio() is bounded above by 2*min(len)/(len_a+len_b), so a plain
+    # length comparison rules out most pairs before any matcher work;
+    # real_quick_ratio/quick_ratio then gate the full O(n^2) pass.
+    la, lb = len(norm_a), len(norm_b)
+    if 2 * min(la, lb) >= threshold * (la + lb):
+        sm = SequenceMatcher(None, norm_a, norm_b)
+        if (
+            sm.real_quick_ratio() >= threshold
+            and sm.quick_ratio() >= threshold
+            and sm.ratio() >= threshold
+        ):
+            return True
 
     # Strategy 2: keyword overlap (catches "same story, different wording")
     jaccard, overlap = keyword_similarity(a, b)
@@ -63,76 +120,168 @@ def _titles_similar(a: str, b: str, threshold: float = 0.85) -> bool:
 
 
 class Deduplicator:
-    """Manages seen articles and filters duplicates."""
+    """Manages seen articles and filters duplicates.
+
+    Entries are held as parallel arrays (URL list + membership set, titles,
+    epoch timestamps) rather than a dict of per-entry dicts, so filter_new
+    reads titles directly and prune is a single index scan.
+    """
 
     def __init__(self, db_path: str | pathlib.Path | None = None):
         self.db_path = pathlib.Path(db_path) if db_path else DEFAULT_DB_PATH
-        self._seen: dict[str, dict] = self._load()
+        self._urls: list[str] = []
+        self._url_set: set[str] = set()
+        self._titles: list[str] = []
+        self._seen_at: list[float] = []
+        # Derived per-title arrays, computed once on load/insert so
+        # filter_new never re-normalizes the seen side
+        self._norm_titles: list[str] = []
+        self._shingle_sets: list[frozenset[str]] = []
+        # Keyword sets as int bitmasks over a store-local vocabulary, so
+        # the pairwise Jaccard in filter_new is popcount arithmetic
+        # instead of hash-set intersections
+        self._kw_vocab: dict[str, int] = {}
+        self._kw_masks: list[int] = []
+        self._dirty = False
+        self._load()
+
+    @property
+    def _seen(self) -> dict[str, dict]:
+        """Dict view of the store, in the on-disk format.
 
-    def _load(self) -> dict[str, dict]:
-        """Load seen articles from disk."""
+        seen_at is stored as an epoch int so load never parses dates and
+        prune compares plain numbers.
+        """
+        return {
+            url: {"title": title, "seen_at": int(ts)}
+            for url, title, ts in zip(self._urls, self._titles, self._seen_at)
+        }
+
+    def _load(self) -> None:
+        """Load seen articles from disk into the parallel arrays."""
         if not self.db_path.exists():
-            return {}
+            return
         try:
-            with open(self.db_path, encoding="utf-8") as f:
-                data = json.load(f)
+            # One read_bytes call + orjson's C parser; falls back to stdlib
+            raw = self.db_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             if not isinstance(data, dict):
                 logger.warning("Invalid seen_articles.json format, resetting")
-                return {}
-            return data
-        except (json.JSONDecodeError, OSError):
+                return
+        except (ValueError, OSError):
             logger.warning("Corrupted seen_articles.json, starting fresh")
-            return {}
+            return
+        for url, entry in data.items():
+            if not isinstance(entry, dict):
+                continue
+            ts = entry.get("seen_at", 0.0)
+            if isinstance(ts, str):
+                # Legacy format: ISO string. Migrated to epoch on next save.
+                try:
+                    ts = datetime.fromisoformat(ts).timestamp()
+                except ValueError:
+                    ts = 0.0  # unreadable timestamp: prune() will drop it
+            elif not isinstance(ts, (int, float)):
+                ts = 0.0
+            title = entry.get("title", "")
+            self._urls.append(url)
+            self._url_set.add(url)
+            self._titles.append(title)
+            self._seen_at.append(ts)
+            norm = normalize_title(title)
+            self._norm_titles.append(norm)
+            self._shingle_sets.append(_shingles(norm))
+            self._kw_masks.append(keyword_bitmask(title, self._kw_vocab))
 
     def save(self) -> None:
-        """Persist seen articles to disk."""
+        """Persist seen articles to disk (no-op when nothing changed)."""
+        if not self._dirty and self.db_path.exists():
+            return
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.db_path, "w", encoding="utf-8") as f:
-            json.dump(self._seen, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            self.db_path.write_bytes(
+                orjson.dumps(self._seen, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(self.db_path, "w", encoding="utf-8") as f:
+                json.dump(self._seen, f, indent=2, ensure_ascii=False)
 
     def prune(self, window_days: int = 7) -> None:
         """Remove entries older than the dedup window."""
-        now = datetime.now(timezone.utc)
-        to_remove = []
-        for key, entry in self._seen.items():
-            try:
-                seen_at = datetime.fromisoformat(entry["seen_at"])
-                if (now - seen_at).days > window_days:
-                    to_remove.append(key)
-            except (KeyError, ValueError):
-                to_remove.append(key)
-        for key in to_remove:
-            del self._seen[key]
-        if to_remove:
-            logger.info("Pruned %d old entries from dedup DB", len(to_remove))
+        cutoff = datetime.now(timezone.utc).timestamp() - window_days * 86400
+        keep = [i for i, ts in enumerate(self._seen_at) if ts >= cutoff]
+        removed = len(self._seen_at) - len(keep)
+        if removed:
+            self._urls = [self._urls[i] for i in keep]
+            self._titles = [self._titles[i] for i in keep]
+            self._seen_at = [self._seen_at[i] for i in keep]
+            self._norm_titles = [self._norm_titles[i] for i in keep]
+            self._shingle_sets = [self._shingle_sets[i] for i in keep]
+            # The vocab keeps bits for pruned words; masks stay valid and
+            # the dict is rebuilt fresh on every run anyway
+            self._kw_masks = [self._kw_masks[i] for i in keep]
+            self._url_set = set(self._urls)
+            self._dirty = True
+            logger.info("Pruned %d old entries from dedup DB", removed)
+
+    def _is_duplicate_title(self, title: str, kw_mask: int) -> bool:
+        """Check a title against all previously seen titles."""
+        norm = normalize_title(title)
+        shingles = _shingles(norm)
+        if _rf_process is not None:
+            # Strategy 1, batched: RapidFuzz scores the whole seen list in C,
+            # with score_cutoff pruning comparisons that cannot reach threshold.
+            if self._norm_titles and _rf_process.extractOne(
+                norm,
+                self._norm_titles,
+                scorer=_rf_fuzz.ratio,
+                score_cutoff=TITLE_SIM_THRESHOLD * 100,
+            ):
+                return True
+            # Strategy 2: keyword overlap (catches cross-source rewrites).
+            # The shingle gate skips pairs with no meaningful word overlap;
+            # survivors are scored via bitmask popcounts, not string sets.
+            for seen_mask, seen_sh in zip(self._kw_masks, self._shingle_sets):
+                if not _shingle_gate(shingles, seen_sh):
+                    continue
+                jaccard, overlap = bitmask_similarity(kw_mask, seen_mask)
+                if jaccard >= 0.6 and overlap >= 3:
+                    return True
+            return False
+        # Fallback: pure-Python pairwise comparison, shingle-gated
+        return any(
+            _shingle_gate(shingles, seen_sh) and _titles_similar(title, seen_title)
+            for seen_title, seen_sh in zip(self._titles, self._shingle_sets)
+        )
 
     def filter_new(self, articles: list[Article]) -> list[Article]:
         """Return only articles not previously seen."""
         new_articles: list[Article] = []
-        seen_titles = [e.get("title", "") for e in self._seen.values()]
+        # One shared timestamp: everything in a single run is "seen" now
+        now_ts = datetime.now(timezone.utc).timestamp()
 
         for article in articles:
             norm_url = normalize_url(article.link)
 
             # Check URL match
-            if norm_url in self._seen:
+            if norm_url in self._url_set:
                 continue
 
             # Check title similarity
-            is_dup = False
-            for seen_title in seen_titles:
-                if _titles_similar(article.title, seen_title):
-                    is_dup = True
-                    break
-            if is_dup:
+            kw_mask = keyword_bitmask(article.title, self._kw_vocab)
+            if self._is_duplicate_title(article.title, kw_mask):
                 continue
 
             # Mark as seen
-            self._seen[norm_url] = {
-                "title": article.title,
-                "seen_at": datetime.now(timezone.utc).isoformat(),
-            }
-            seen_titles.append(article.title)
+            self._urls.append(norm_url)
+            self._url_set.add(norm_url)
+            self._titles.append(article.title)
+            self._seen_at.append(now_ts)
+            norm = normalize_title(article.title)
+            self._norm_titles.append(norm)
+            self._shingle_sets.append(_shingles(norm))
+            self._kw_masks.append(kw_mask)
+            self._dirty = True
             new_articles.append(article)
 
         logger.info(
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import io
 import logging
-from collections import defaultdict
 from datetime import datetime, timezone
+from itertools import groupby
+from operator import attrgetter
+from typing import TextIO
 
 from .parser import Article
 
@@ -15,61 +18,66 @@ def format_digest(
     articles: list[Article],
     date: datetime | None = None,
     feed_stats: dict[str, bool] | None = None,
+    out: TextIO | None = None,
 ) -> str:
-    """Generate a Markdown digest grouped by category."""
+    """Generate a Markdown digest grouped by category.
+
+    Writes incrementally instead of accumulating a line list. When ``out``
+    is given (e.g. an open file), the digest is written there and an empty
+    string is returned; otherwise the full document is returned.
+    """
     if date is None:
         date = datetime.now(timezone.utc)
 
     date_str = date.strftime("%Y-%m-%d")
-    lines: list[str] = []
+    buf = out if out is not None else io.StringIO()
+    write = buf.write
 
     # Header
-    lines.append(f"# Daily News Digest / デイリーニュースダイジェスト")
-    lines.append(f"## {date_str}")
-    lines.append("")
+    write("# Daily News Digest / デイリーニュースダイジェスト\n")
+    write(f"## {date_str}\n")
+    write("\n")
 
     if not articles:
-        lines.append("No new articles today. / 本日の新着記事はありません。")
-        lines.append("")
-        return "\n".join(lines)
-
-    # Group by category
-    by_category: dict[str, list[Article]] = defaultdict(list)
-    for article in articles:
-        by_category[article.category].append(article)
+        write("No new articles today. / 本日の新着記事はありません。\n")
+        return buf.getvalue() if out is None else ""
 
-    # Render each category
-    for category, cat_articles in by_category.items():
+    # One sort by (category, published) gives deterministic category order
+    # and chronological articles within each; groupby then renders each
+    # category without building an intermediate dict of lists.
+    articles_sorted = sorted(articles, key=lambda a: (a.category, a.published))
+    cat_count = 0
+    for category, group in groupby(articles_sorted, key=attrgetter("category")):
+        cat_articles = list(group)
+        cat_count += 1
         cat_ja = cat_articles[0].category_ja
-        lines.append(f"## {category} / {cat_ja}")
-        lines.append("")
+        write(f"## {category} / {cat_ja}\n")
+        write("\n")
 
         for i, article in enumerate(cat_articles, 1):
-            lines.append(f"### {i}. {article.title}")
-            lines.append(f"- **Source**: {article.source_name}")
-            lines.append(f"- **Published**: {article.published.strftime('%Y-%m-%d %H:%M UTC')}")
-            lines.append(f"- **Link**: {article.link}")
+            write(f"### {i}. {article.title}\n")
+            write(f"- **Source**: {article.source_name}\n")
+            write(f"- **Published**: {article.published.strftime('%Y-%m-%d %H:%M UTC')}\n")
+            write(f"- **Link**: {article.link}\n")
             if article.summary:
-                lines.append(f"- **Summary**: {article.summary}")
-            lines.append("")
+                write(f"- **Summary**: {article.summary}\n")
+            write("\n")
 
     # Footer
     total = len(articles)
-    cat_count = len(by_category)
-    lines.append("---")
-    lines.append(
+    write("---\n")
+    write(
         f"*{total} articles from {cat_count} categories / "
-        f"{total}件の記事、{cat_count}カテゴリ*"
+        f"{total}件の記事、{cat_count}カテゴリ*\n"
     )
 
     # Feed status
     if feed_stats:
         ok = sum(1 for v in feed_stats.values() if v)
         fail = sum(1 for v in feed_stats.values() if not v)
-        lines.append(f"*Feeds: {ok} succeeded, {fail} failed*")
+        write(f"*Feeds: {ok} succeeded, {fail} failed*\n")
         if fail > 0:
             failed_names = [k for k, v in feed_stats.items() if not v]
-            lines.append(f"*Failed feeds: {', '.join(failed_names)}*")
+            write(f"*Failed feeds: {', '.join(failed_names)}*\n")
 
-    lines.append("")
-    return "\n".join(lines)
+    return buf.getvalue() if out is None else ""
@@ -111,14 +111,13 @@ def run_collect(verbose: bool = False) -> None:
     #    API budget is reserved for the briefing stage where it matters most.
     summarized = new_articles
 
-    # 5. Save daily digest file
+    # 5. Save daily digest file (streamed straight to disk)
     now = datetime.now(timezone.utc)
     date_str = now.strftime("%Y-%m-%d")
-    digest_content = format_digest(summarized, date=now, feed_stats=feed_stats)
-
     digest_path = PROJECT_ROOT / "digests" / f"{date_str}.md"
     digest_path.parent.mkdir(parents=True, exist_ok=True)
-    digest_path.write_text(digest_content, encoding="utf-8")
+    with open(digest_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        format_digest(summarized, date=now, feed_stats=feed_stats, out=f)
     logger.info("Digest written to %s", digest_path)
 
     # 6. Append to weekly buffer (with URL dedup to prevent duplicates)
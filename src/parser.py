@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import html
+import json
 import logging
+import pathlib
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from time import mktime
 
 import feedparser
 
@@ -18,8 +19,34 @@ logger = logging.getLogger(__name__)
 
 USER_AGENT = "NewsDigestBot/1.0 (+https://github.com/news-digest)"
 
+# Sidecar with per-feed ETag/Last-Modified values for conditional GETs
+HTTP_CACHE_PATH = pathlib.Path(__file__).resolve().parent.parent / "data" / "http_cache.json"
 
-@dataclass
+
+def _load_http_cache() -> dict[str, dict]:
+    """Load the conditional-GET sidecar. Returns {} on any problem."""
+    if not HTTP_CACHE_PATH.exists():
+        return {}
+    try:
+        data = json.loads(HTTP_CACHE_PATH.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except (ValueError, OSError):
+        logger.warning("Corrupted http_cache.json, ignoring")
+        return {}
+
+
+def _save_http_cache(cache: dict[str, dict]) -> None:
+    """Persist the conditional-GET sidecar (best effort)."""
+    try:
+        HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        HTTP_CACHE_PATH.write_text(
+            json.dumps(cache, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+    except OSError:
+        logger.warning("Failed to write http_cache.json")
+
+
+@dataclass(slots=True, frozen=True)
 class Article:
     id: str
     title: str
@@ -31,27 +58,52 @@ class Article:
     category_ja: str
 
 
+# Sentinel returned by fetch_articles on HTTP 304 so callers can tell a
+# healthy-but-unchanged feed apart from one that failed or was empty.
+# Compared by identity; plain [] returns elsewhere stay "failed".
+_FEED_UNCHANGED: list[Article] = []
+
+# One alternation handles both tag removal and whitespace collapsing in a
+# single scan: tags become "", whitespace runs become a single space.
+_TAG_WS_RE = re.compile(r"<[^>]+>|\s+")
+
+
+def _strip_tag_or_ws(match: re.Match[str]) -> str:
+    return "" if match.group(0).startswith("<") else " "
+
+
 def _strip_html(text: str) -> str:
-    """Remove HTML tags and decode entities."""
-    text = re.sub(r"<[^>]+>", "", text)
-    text = html.unescape(text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    """Remove HTML tags and decode entities.
+
+    Unescaping runs after the sweep (so "&lt;b&gt;" isn't eaten as a tag),
+    which means entity-encoded whitespace like &#10; or &nbsp; only appears
+    afterwards — the final split/join collapses it so summaries stay on
+    one line in the digest.
+    """
+    return " ".join(html.unescape(_TAG_WS_RE.sub(_strip_tag_or_ws, text)).split())
 
 
 def _parse_date(entry: dict) -> datetime:
-    """Extract published date from a feed entry."""
-    if hasattr(entry, "published_parsed") and entry.published_parsed:
-        return datetime.fromtimestamp(mktime(entry.published_parsed), tz=timezone.utc)
-    if hasattr(entry, "updated_parsed") and entry.updated_parsed:
-        return datetime.fromtimestamp(mktime(entry.updated_parsed), tz=timezone.utc)
-    return datetime.now(timezone.utc)
+    """Extract published date from a feed entry.
+
+    feedparser's *_parsed tuples are already UTC, so the datetime is
+    built straight from the first six fields — no mktime round-trip
+    through the local timezone.
+    """
+    tt = (
+        getattr(entry, "published_parsed", None)
+        or getattr(entry, "updated_parsed", None)
+    )
+    if tt is None:
+        return datetime.now(timezone.utc)
+    return datetime(tt[0], tt[1], tt[2], tt[3], tt[4], tt[5], tzinfo=timezone.utc)
 
 
 def fetch_articles(
     source: FeedSource,
     max_articles: int = 10,
     max_age_hours: float | None = None,
+    http_cache: dict[str, dict] | None = None,
 ) -> list[Article]:
     """Fetch and normalize articles from a single RSS feed.
 
@@ -60,15 +112,31 @@ def fetch_articles(
         max_articles: Maximum number of entries to process from the feed.
         max_age_hours: If set, skip articles older than this many hours.
             Articles without a parseable date are always included.
+        http_cache: Optional conditional-GET state keyed by feed URL. When
+            given, the stored ETag/Last-Modified values are sent so
+            unchanged feeds come back as an empty 304 response instead of
+            a full download and parse.
 
     Returns an empty list on failure (never crashes).
     """
     try:
+        cached = http_cache.get(source.url) if http_cache else None
+        # Skip feedparser's per-entry relative-URI resolution and HTML
+        # sanitization passes: links in the feeds are absolute, and entry
+        # HTML is stripped wholesale by _strip_html anyway.
         feed = feedparser.parse(
             source.url,
             agent=USER_AGENT,
+            etag=cached.get("etag") if cached else None,
+            modified=cached.get("modified") if cached else None,
+            resolve_relative_uris=False,
+            sanitize_html=False,
         )
 
+        if getattr(feed, "status", None) == 304:
+            logger.info("Feed unchanged (304): %s", source.name)
+            return _FEED_UNCHANGED
+
         if feed.bozo and not feed.entries:
             logger.warning("Feed error for %s: %s", source.name, feed.bozo_exception)
             return []
@@ -107,6 +175,12 @@ def fetch_articles(
                 )
             )
 
+        if http_cache is not None:
+            etag = getattr(feed, "etag", None)
+            modified = getattr(feed, "modified", None)
+            if isinstance(etag, str) or isinstance(modified, str):
+                http_cache[source.url] = {"etag": etag, "modified": modified}
+
         logger.info("Fetched %d articles from %s", len(articles), source.name)
         return articles
 
@@ -118,7 +192,7 @@ def fetch_articles(
 def fetch_all_articles(
     sources: list[FeedSource],
     max_articles: int = 10,
-    max_workers: int = 8,
+    max_workers: int | None = None,
     max_age_hours: float | None = None,
 ) -> tuple[list[Article], dict[str, bool]]:
     """Fetch articles from all feeds in parallel using a thread pool.
@@ -126,14 +200,20 @@ def fetch_all_articles(
     Args:
         sources: List of feed sources to fetch.
         max_articles: Default maximum articles per feed.
-        max_workers: Thread pool size.
+        max_workers: Thread pool size. Defaults to one thread per feed
+            (capped at 32) so total latency tracks the slowest feed
+            rather than a fixed-width queue.
         max_age_hours: If set, skip articles older than this many hours.
 
     Returns a tuple of (all_articles, feed_stats) where feed_stats maps
     each feed name to whether it succeeded (had at least one article).
     """
+    if max_workers is None:
+        max_workers = min(32, len(sources) or 1)
     all_articles: list[Article] = []
     feed_stats: dict[str, bool] = {}
+    # Shared across workers; each feed touches only its own URL key
+    http_cache = _load_http_cache()
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_source = {
@@ -142,6 +222,7 @@ def fetch_all_articles(
                 source,
                 source.max_articles if source.max_articles is not None else max_articles,
                 max_age_hours,
+                http_cache,
             ): source
             for source in sources
         }
@@ -150,10 +231,15 @@ def fetch_all_articles(
             source = future_to_source[future]
             try:
                 articles = future.result()
-                feed_stats[source.name] = len(articles) > 0
+                # A 304 means the feed is fine, there was just nothing new —
+                # don't list it under "failed feeds" in the digest footer
+                feed_stats[source.name] = (
+                    articles is _FEED_UNCHANGED or len(articles) > 0
+                )
                 all_articles.extend(articles)
             except Exception:
                 logger.exception("Unexpected error fetching %s", source.name)
                 feed_stats[source.name] = False
 
+    _save_http_cache(http_cache)
     return all_articles, feed_stats
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import html
 import json
 import logging
+import pathlib
+import random
 import re
+import threading
 import time
 import urllib.request
 from abc import ABC, abstractmethod
@@ -14,8 +18,17 @@ from dataclasses import replace
 
 from html.parser import HTMLParser as _StdHTMLParser
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
 from .parser import Article
-from .text_utils import keyword_similarity
+from .text_utils import bitmask_similarity, keyword_bitmask
 
 logger = logging.getLogger(__name__)
 
@@ -40,18 +53,19 @@ class _ArticleExtractor(_StdHTMLParser):
 
     # -- parser callbacks --------------------------------------------------
 
+    # HTMLParser already lowercases tag names before dispatching, so the
+    # callbacks test set membership directly without re-lowering.
+
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        t = tag.lower()
-        if t in self._SKIP_TAGS:
+        if tag in self._SKIP_TAGS:
             self._skip_depth += 1
-        if t in self._CONTENT_TAGS and self._skip_depth == 0:
+        if tag in self._CONTENT_TAGS and self._skip_depth == 0:
             self._content_depth += 1
 
     def handle_endtag(self, tag: str) -> None:
-        t = tag.lower()
-        if t in self._SKIP_TAGS and self._skip_depth > 0:
+        if tag in self._SKIP_TAGS and self._skip_depth > 0:
             self._skip_depth -= 1
-        if t in self._CONTENT_TAGS and self._content_depth > 0:
+        if tag in self._CONTENT_TAGS and self._content_depth > 0:
             self._content_depth -= 1
 
     def handle_data(self, data: str) -> None:
@@ -164,6 +178,15 @@ _READER_STACK_KEYWORDS = frozenset({
 })
 
 
+# All stack keywords as one alternation: a single C-level scan of the
+# text replaces ~100 Python-level substring checks per ArXiv article.
+# re.escape keeps plain-substring semantics for entries like "ci/cd",
+# "cve-" and "next.js".
+_RELEVANCE_RE = re.compile(
+    "|".join(re.escape(kw) for kw in sorted(_READER_STACK_KEYWORDS))
+)
+
+
 def _is_relevant_for_reader(article: Article) -> bool:
     """Check if an article is relevant to the reader's tech stack.
 
@@ -173,20 +196,185 @@ def _is_relevant_for_reader(article: Article) -> bool:
     if "arxiv.org" not in article.link:
         return True
     text = (article.title + " " + article.summary).lower()
-    return any(kw in text for kw in _READER_STACK_KEYWORDS)
+    return _RELEVANCE_RE.search(text) is not None
 
-_PROMPT_TEMPLATE = (
+# Prompt pieces are plain constants joined by +, so building a prompt is
+# string concatenation with no per-call template parsing
+_PROMPT_HEAD = (
     "以下のニュース記事のタイトルと概要を読んで、日本語で1〜2文の簡潔な要約を書いてください。"
     "要約のみを返してください。\n\n"
-    "タイトル: {title}\n"
-    "概要: {summary}"
+    "タイトル: "
 )
+_PROMPT_MID = "\n概要: "
+
+# Hiragana/katakana/CJK: a summary containing these is already Japanese
+_JA_RE = re.compile(r"[぀-ヿ一-龯]")
 
-_BATCH_PROMPT_TEMPLATE = (
+# Numbered item prefix in batch responses, e.g. "1. " or "2) "
+_NUM_ITEM_SPLIT_RE = re.compile(r"(?m)^\d+[.)]\s*")
+
+_BATCH_PROMPT_HEAD = (
     "以下の複数のニュース記事について、それぞれ日本語で1〜2文の簡潔な要約を書いてください。\n"
     "各要約は番号付きで返してください（例: 1. 要約文）。\n"
     "要約のみを返してください。\n\n"
-    "{articles}"
+)
+
+# Static skeletons of the briefing-stage prompts, hoisted to module level.
+# The per-call article payload is appended last, so every call shares an
+# identical prefix — the layout Gemini's implicit prompt caching rewards.
+_SELECT_PROMPT_HEAD = (
+    "あなたはデータエンジニア・セキュリティエンジニア兼日本株・米国株の個人投資家向けの"
+    "シニアニュースアナリストです。\n"
+    "以下の記事一覧から、読者にとって本当に重要な記事を**12〜15件**選んでください。\n\n"
+    "## 読者の技術スタック\n"
+    "読者は以下の技術を日常的に使うデータエンジニア・セキュリティエンジニアです。"
+    "これらに関連する記事は優先的に選んでください:\n"
+    "- 言語: TypeScript/Next.js, Python, Go, Rust, Spark\n"
+    "- インフラ: Kubernetes, Docker, Kafka, MySQL, Cassandra, Redis, Hadoop, Athenz\n"
+    "- データ基盤: dbt, Airflow, Databricks, BigQuery, Athena\n"
+    "- AI/LLM: RAG, Vector DB, Embedding, LLMエージェント, Function Calling\n"
+    "- クラウド: AWS, GCP, Azure, Terraform, Cloudflare, GitHub Actions\n\n"
+    "## 必須の選定配分\n"
+    "以下のカテゴリごとに最低限の記事数を確保すること:\n"
+    "- AI・LLM: 2〜3件（モデルリリース、API変更、実用的なRAG/Agent手法を優先。"
+    "理論のみの論文は除外）\n"
+    "- セキュリティ: 2〜4件（実際に悪用されているCVE、重大な脆弱性、攻撃キャンペーンのみ。"
+    "一般論や啓蒙記事は除外）\n"
+    "- マーケット/投資: 2〜3件（具体的数値・指標・決算を含む記事を優先。"
+    "数字のない一般的な経済論評は除外）\n"
+    "- クラウド・DevOps: 1〜2件（AWS/GCP/Azure/CI-CDの具体的サービス更新・障害情報）\n"
+    "- データエンジニアリング: 1〜2件（dbt/Airflow/Spark/BigQuery等の具体的ツール更新・"
+    "アーキテクチャ変更を含む記事）\n"
+    "- テクノロジー全般: 2〜4件（読者スタックに直結する記事を優先）\n"
+    "- 世間の話題: 0〜2件（テック以外でも社会的に大きなニュースがあれば含める。"
+    "政治・経済・災害・国際情勢など、話題として知っておくべきもの）\n\n"
+    "## 選定基準（優先順）\n"
+    "1. **アクション可能か？**: 読者が読んだ後に「何かすべきこと」がある記事を最優先\n"
+    "   （例: パッチ適用、API移行、設定変更、投資判断、ツール導入検討）\n"
+    "2. 具体的な数値・メトリクス・CVE番号・バージョン番号を含む記事\n"
+    "3. 投資判断に直結（マクロ指標の具体数値、決算、セクター動向）\n"
+    "4. 世間で大きな話題になっている出来事（テック以外でも社会的インパクトが大きいもの）\n"
+    "5. 日本語テック記事も選定対象（英語記事と同一トピックの場合は英語版を優先）\n\n"
+    "## 除外基準（以下に該当する記事は選ばない）\n"
+    "- 「〜が発表された」だけで具体的中身がない速報\n"
+    "- 製品の宣伝・マーケティング色が強い記事\n"
+    "- 既に広く知られている事実の繰り返し解説\n"
+    "- 抽象的な「トレンド予測」や「〜が重要になる」系の記事\n"
+    "- チュートリアルや入門記事（読者はシニアエンジニア）\n"
+    "- 似たテーマの記事は最も情報量の多い1件だけ選ぶ\n\n"
+    "## 出力形式\n"
+    "選んだ記事の番号をJSON配列で返してください。それ以外のテキストは不要です。\n"
+    "例: [0, 3, 5, 7, 9, 12, 15, 18]\n\n"
+)
+
+_BRIEFING_PROMPT_HEAD = (
+    "あなたはベテランのテックジャーナリストです。データエンジニア・セキュリティエンジニア兼"
+    "個人投資家（日米株）向けのデイリーブリーフィングを日本語で作成してください。\n\n"
+    "## 読者\n"
+    "- 技術スタック: TypeScript/Next.js, Python, Go, Rust, Spark, "
+    "Kubernetes, Docker, Kafka, MySQL, Cassandra, Redis, Hadoop, Athenz, "
+    "dbt, Airflow, Databricks, BigQuery, Athena\n"
+    "- AI/LLM: RAG, Vector DB, LLMエージェント, Function Calling を実務で活用\n"
+    "- クラウド: AWS, GCP, Azure, Terraform, Cloudflare\n"
+    "- 読者のスタックに直結する話題は技術名を挙げて影響を具体的に述べる\n"
+    "- 読者は日米の個別株・ETFに投資している。ニュースの投資インパクトを知りたい\n\n"
+    "## 禁止表現（これらを使ったら書き直す）\n"
+    "- 「〜に注目が集まっています」「〜が重要です」「〜が求められています」\n"
+    "- 「〜の可能性があります」で終わる文\n"
+    "- 「エンジニアは注意が必要です」「対策が急務です」\n"
+    "- 「〜が進んでいます」「〜が加速しています」\n"
+    "- 「今後の動向に注目」「引き続き注視」\n"
+    "- 「〜が期待されます」「〜が見込まれます」（根拠なしの場合）\n"
+    "- 同じ語尾の3連続（「〜した。〜した。〜した。」は不可）\n\n"
+    "## 文体\n"
+    "- 1トピック5〜8行。事実・背景・読者への影響を踏み込んで書く\n"
+    "- 1文は40字以内。長い文は分割する\n"
+    "- 基本構成: 事実(1〜2文) ＋ 技術的背景(1〜2文) ＋ 読者の業務への影響(1〜2文)\n"
+    "- 全トピックの末尾に 📎 [記事タイトル](URL) 必須。例外なし\n"
+    "- 複数の関連記事は1トピックにまとめてよい\n"
+    "- 各バレットポイントには必ず1つ以上の具体的事実（数値、固有名詞、バージョン番号、"
+    "CVE番号など）を含める。具体性のないバレットは書かない\n"
+    "- **悪い例**: 「Kubernetesの新バージョンがリリースされた。新機能が追加されている。」"
+    "（何の新機能か不明。読者が何をすべきかわからない）\n"
+    "- **良い例**: 「Kubernetes v1.32でGateway APIがGA昇格。"
+    "Ingress廃止ロードマップが前進し、v1.30以前のHPA manifestは移行が必要。」"
+    "（バージョン、変更点、影響が明確）\n\n"
+    "## セクション構成\n\n"
+    "### `## 🔥 本日のハイライト`\n"
+    "最重要の3件のみ。各セクションと重複しないこと。\n"
+    "- **太字見出し**（10字前後）\n"
+    "- 事実1文 + 意味1文\n"
+    "- 📎 リンク\n\n"
+    "### `## 🤖 AI・LLM`\n"
+    "AI/ML関連。モデルリリース、API変更、実用的なRAG/Agent/ツール活用法のみ。最大3件。\n"
+    "読者はLLMを実務で使うエンジニア。理論より実装・運用への影響を具体的に述べる。\n"
+    "📎 リンク必須。\n\n"
+    "### `## 🛠️ テクノロジー`\n"
+    "読者の技術スタック（TypeScript, Python, Go, K8s, Kafka等）に直結するトピックのみ。\n"
+    "ハイライトと重複しない別のトピック。最大3件。\n"
+    "具体的なバージョン番号、API変更点、マイグレーション手順があれば明記。\n"
+    "📎 リンク必須。\n\n"
+    "### `## ☁️ クラウド・DevOps`\n"
+    "AWS/GCP/Azure、CI/CD、IaC、CDN関連。該当なしなら省略。最大3件。\n"
+    "サービスのバージョン、料金変更、アーキテクチャ変更の具体値を含める。\n"
+    "📎 リンク必須。\n\n"
+    "### `## 📊 データエンジニアリング`\n"
+    "データ基盤・パイプライン関連。該当なしなら省略。最大3件。\n"
+    "dbt/Airflow/Spark/BigQuery/Databricks等の具体名で影響を述べる。\n"
+    "ツールのバージョン、設定変更点、パフォーマンス改善の具体数値を含める。\n"
+    "📎 リンク必須。\n\n"
+    "### `## 🔒 セキュリティ`\n"
+    "脆弱性・攻撃動向。該当なしなら省略。**最大5件、影響度順**。\n"
+    "各項目に必須: (1)CVE番号（あれば）, (2)影響を受けるソフトウェア・バージョン, "
+    "(3)深刻度（Critical/High/Medium）, (4)具体的対応策（パッチ適用、設定変更等）\n"
+    "類似の脆弱性は1トピックにまとめる。\n"
+    "📎 リンク必須。\n\n"
+    "### `## 🌍 世間の話題`\n"
+    "テック以外で社会的インパクトが大きいニュース。該当なしなら省略。最大2件。\n"
+    "政治・経済政策・国際情勢・災害・社会現象など。\n"
+    "エンジニアや投資家としてどう関係するかを1文添える。\n"
+    "📎 リンク必須。\n\n"
+    "### `## 📈 マーケット`\n"
+    "**記事本文から抽出した具体的数値のみ記載**。以下を可能な限り含む:\n"
+    "- 株価指数（S&P500, NASDAQ, 日経225, TOPIX）の数値と前日比%\n"
+    "- 為替（USD/JPY）の水準\n"
+    "- 米国債利回り（10年）の水準\n"
+    "- 個別銘柄の決算・株価変動（ティッカーシンボル付き）\n"
+    "**記事に数値がない場合は「データ不足：該当記事に具体的数値の記載なし」と正直に書く。**\n"
+    "数値を捏造・推測しないこと。\n"
+    "📎 リンク必須。\n\n"
+    "### `## 🔮 今後の注目`\n"
+    "1〜2週間以内のイベント・予測を2〜3点。**具体的な日付を必ず明記**。\n"
+    "漠然とした予測は書かない。\n\n"
+    "## ルール\n"
+    "- 記事本文を踏まえて書く（RSS概要だけに頼らない）\n"
+    "- 「だから何？」を常に意識。事実の羅列は不可\n"
+    "- 複数記事を横断的に結びつけてトレンドを抽出\n"
+    "- ハイライトの記事は他セクションに書かない（重複厳禁）\n"
+    "- 冒頭挨拶・末尾締め不要。セクションだけ出力\n"
+    "- 記事に書かれていない数値や事実を捏造しない\n"
+    "- 日本語ソースの記事は日本語のまま自然に組み込む\n"
+    "- 日本語と英語で同じトピックの場合、1つにまとめて両方のリンクを付ける\n\n"
+)
+
+_REFINE_PROMPT_HEAD = (
+    "以下のデイリーブリーフィングの原稿を改善してください。\n\n"
+    "## 改善方針（LLMでしかできないことに集中）\n"
+    "1. 浅い分析を深める: 事実の羅列を「だから何？」まで踏み込んだ分析に書き換える\n"
+    "   - 各トピックで「読者（AI/LLMを実務で活用するデータエンジニア・セキュリティエンジニア）の日常業務にどう影響するか」を\n"
+    "     1文追加する\n"
+    "2. 関連トピックの横断: 複数の記事に共通するトレンドがあれば言及する\n"
+    "3. 語尾の単調さ解消: 同じ語尾が3回以上連続していたら変える\n"
+    "4. 1文が40字を超えていたら分割する\n\n"
+    "## 禁止事項\n"
+    "- 情報を追加・捏造しない（原稿にある情報だけで改善）\n"
+    "- セクション構造は変更しない\n"
+    "- リンクの追加・削除はしない\n"
+    "- 以下の表現は使わない: "
+    "「注目が集まっています」「が重要です」「が求められています」「注意が必要です」"
+    "「対策が急務です」「が進んでいます」「が加速しています」「今後の動向に注目」"
+    "「引き続き注視」「が期待されます」「が見込まれます」\n\n"
+    "改善後のブリーフィング全文のみを出力してください。\n\n"
 )
 
 
@@ -209,6 +397,67 @@ class PassthroughSummarizer(Summarizer):
 GEMINI_ENDPOINT_FLASH = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent"
 GEMINI_ENDPOINT_PRO = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-pro:generateContent"
 
+# ------------------------------------------------------------------
+# Response cache: identical (model, prompt) pairs skip the API entirely.
+# Recurring stories and re-runs during development hit the cache instead
+# of spending quota and a multi-second LLM round-trip.
+# ------------------------------------------------------------------
+
+_CACHE_PATH = pathlib.Path(__file__).resolve().parent.parent / ".cache" / "gemini.json"
+_cache_lock = threading.Lock()
+_response_cache: dict[str, str] | None = None
+
+
+def _cache_key(endpoint: str, prompt: str) -> str:
+    return hashlib.sha256(f"{endpoint}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def _cache_get(endpoint: str, prompt: str) -> str | None:
+    global _response_cache
+    with _cache_lock:
+        if _response_cache is None:
+            try:
+                raw = _CACHE_PATH.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                _response_cache = data if isinstance(data, dict) else {}
+            except (ValueError, OSError):
+                _response_cache = {}
+        return _response_cache.get(_cache_key(endpoint, prompt))
+
+
+def _cache_put(endpoint: str, prompt: str, text: str) -> None:
+    with _cache_lock:
+        if _response_cache is None:
+            return
+        _response_cache[_cache_key(endpoint, prompt)] = text
+        try:
+            _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            payload = (
+                orjson.dumps(_response_cache)
+                if orjson is not None
+                else json.dumps(_response_cache, ensure_ascii=False).encode("utf-8")
+            )
+            _CACHE_PATH.write_bytes(payload)
+        except OSError:
+            logger.debug("Failed to write Gemini response cache")
+
+# Cap in-flight Gemini requests so parallel callers stay within API QPS limits
+_gemini_gate = threading.BoundedSemaphore(4)
+
+# Shared session so consecutive Gemini calls reuse one TLS connection.
+# The adapter keeps enough pooled sockets for the 4-way summarize
+# concurrency and transparently retries connection setup; HTTP-status
+# retries stay in call_gemini's own backoff loop so they aren't doubled.
+_gemini_session = requests.Session()
+_gemini_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=8,
+        max_retries=Retry(connect=3, read=0, status=0, other=0, backoff_factor=0.5),
+    ),
+)
+
 
 def call_gemini(prompt: str, api_key: str, max_retries: int = 2, use_pro: bool = False) -> str | None:
     """Call Gemini API with retry logic and return the generated text.
@@ -217,27 +466,58 @@ def call_gemini(prompt: str, api_key: str, max_retries: int = 2, use_pro: bool =
     When use_pro=True, uses Gemini 2.5 Pro for higher quality output.
     """
     endpoint = GEMINI_ENDPOINT_PRO if use_pro else GEMINI_ENDPOINT_FLASH
+
+    cached = _cache_get(endpoint, prompt)
+    if cached is not None:
+        logger.debug("Gemini response cache hit")
+        return cached
+
     url = f"{endpoint}?key={api_key}"
-    payload = json.dumps({
+    payload = {
         "contents": [{"parts": [{"text": prompt}]}],
-    }).encode("utf-8")
+    }
+    # Encode once up front (orjson when available) instead of letting
+    # requests re-serialize the same dict on every retry attempt
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
 
     for attempt in range(max_retries + 1):
-        req = urllib.request.Request(
-            url,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
         try:
-            with urllib.request.urlopen(req, timeout=60) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-            return data["candidates"][0]["content"]["parts"][0]["text"].strip()
+            with _gemini_gate:
+                resp = _gemini_session.post(url, data=body, headers=headers, timeout=60)
+            resp.raise_for_status()
+            # Parse the raw bytes with orjson's C parser; resp.json() would
+            # go through requests' slower charset detection + stdlib json
+            data = orjson.loads(resp.content) if orjson is not None else resp.json()
+            text = data["candidates"][0]["content"]["parts"][0]["text"].strip()
+            _cache_put(endpoint, prompt, text)
+            return text
+        except requests.HTTPError as exc:
+            status = exc.response.status_code if exc.response is not None else 0
+            # Only rate limits and server errors are transient; other 4xx
+            # (bad request, auth) will fail identically on retry, and
+            # retrying them would just burn the backoff delay.
+            if status != 429 and not 500 <= status < 600:
+                logger.error("Gemini API returned %d, not retrying", status)
+                return None
+            if attempt >= max_retries:
+                logger.error(
+                    "Gemini API returned %d after %d attempts", status, max_retries + 1,
+                )
+                return None
+            delay = 5 * 2**attempt + random.uniform(0, 1)
+            logger.warning(
+                "Gemini API returned %d (attempt %d/%d), retrying in %.1fs",
+                status, attempt + 1, max_retries + 1, delay,
+            )
+            time.sleep(delay)
         except Exception:
+            # Connection/timeout errors and malformed payloads: retry with
+            # the same backoff — these are usually transient blips.
             if attempt < max_retries:
-                delay = 5 * (attempt + 1)
+                delay = 5 * 2**attempt + random.uniform(0, 1)
                 logger.warning(
-                    "Gemini API call failed (attempt %d/%d), retrying in %ds",
+                    "Gemini API call failed (attempt %d/%d), retrying in %.1fs",
                     attempt + 1, max_retries + 1, delay,
                 )
                 time.sleep(delay)
@@ -251,8 +531,27 @@ def call_gemini(prompt: str, api_key: str, max_retries: int = 2, use_pro: bool =
 class GeminiSummarizer(Summarizer):
     """Summarizes articles in Japanese using Google Gemini API."""
 
+    # Adaptive batch sizing (AIMD): grow by one after each cleanly parsed
+    # batch response, halve on a parse mismatch. Larger batches mean fewer
+    # HTTP round-trips, but past a point the model starts merging or
+    # dropping numbered items; this converges near the largest size the
+    # model answers reliably.
+    _BATCH_SIZE_START = 10
+    _BATCH_SIZE_MAX = 15
+    _BATCH_SIZE_MIN = 2
+
     def __init__(self, api_key: str):
         self.api_key = api_key
+        self._batch_size = self._BATCH_SIZE_START
+        self._batch_size_lock = threading.Lock()
+
+    def _record_batch_result(self, parsed_ok: bool) -> None:
+        """Adjust the adaptive batch size from a batch parse outcome."""
+        with self._batch_size_lock:
+            if parsed_ok:
+                self._batch_size = min(self._batch_size + 1, self._BATCH_SIZE_MAX)
+            else:
+                self._batch_size = max(self._batch_size // 2, self._BATCH_SIZE_MIN)
 
     def _call_gemini(self, prompt: str, use_pro: bool = False) -> str | None:
         """Call Gemini API and return the generated text."""
@@ -260,7 +559,7 @@ class GeminiSummarizer(Summarizer):
 
     def _summarize_single(self, article: Article) -> Article:
         """Summarize a single article via Gemini API."""
-        prompt = _PROMPT_TEMPLATE.format(title=article.title, summary=article.summary)
+        prompt = _PROMPT_HEAD + article.title + _PROMPT_MID + article.summary
         ja_summary = self._call_gemini(prompt)
         if ja_summary:
             return replace(article, summary=ja_summary)
@@ -272,15 +571,24 @@ class GeminiSummarizer(Summarizer):
 
         Falls back to individual calls if the batch call fails.
         """
-        articles_text = "\n".join(
-            f"{i + 1}. タイトル: {a.title}\n   概要: {a.summary}"
-            for i, a in enumerate(batch)
-        )
-        prompt = _BATCH_PROMPT_TEMPLATE.format(articles=articles_text)
+        # One-or-all: a trailing singleton batch skips the numbered
+        # prompt and response parsing entirely.
+        if len(batch) == 1:
+            return [self._summarize_single(batch[0])]
+        # Cap per-article input: 400 chars of RSS summary is plenty for a
+        # 1-2 sentence output and keeps the upload small.
+        lines = [
+            f"{i}. タイトル: {a.title}\n   概要: {a.summary[:400]}"
+            for i, a in enumerate(batch, 1)
+        ]
+        prompt = _BATCH_PROMPT_HEAD + "\n".join(lines)
         response = self._call_gemini(prompt)
 
         if response:
             summaries = self._parse_batch_response(response, len(batch))
+            # Only a received response says anything about batch size;
+            # HTTP failures are not a parse-quality signal.
+            self._record_batch_result(summaries is not None)
             if summaries:
                 results: list[Article] = []
                 for article, summary in zip(batch, summaries):
@@ -297,21 +605,11 @@ class GeminiSummarizer(Summarizer):
 
         Returns None if parsing fails or count doesn't match.
         """
-        import re
-        lines = response.strip().split("\n")
-        summaries: list[str] = []
-        current = ""
-        for line in lines:
-            match = re.match(r"^\d+[\.\)]\s*", line)
-            if match:
-                if current:
-                    summaries.append(current.strip())
-                current = line[match.end():]
-            else:
-                if current:
-                    current += " " + line.strip()
-        if current:
-            summaries.append(current.strip())
+        # One multiline split on the numbered prefixes yields every item at
+        # once; joining each part's lines replaces the old per-line string
+        # concatenation. Part 0 is whatever preceded "1." (usually empty).
+        parts = _NUM_ITEM_SPLIT_RE.split(response.strip())[1:]
+        summaries = [" ".join(p.split()) for p in parts if p.strip()]
 
         if len(summaries) == expected_count:
             return summaries
@@ -322,13 +620,66 @@ class GeminiSummarizer(Summarizer):
         )
         return None
 
-    def summarize(self, articles: list[Article], batch_size: int = 5) -> list[Article]:
-        logger.info("GeminiSummarizer: summarizing %d articles in Japanese (batch_size=%d)", len(articles), batch_size)
-        results: list[Article] = []
-        for i in range(0, len(articles), batch_size):
-            batch = articles[i : i + batch_size]
-            results.extend(self._summarize_batch(batch))
-        return results
+    def summarize(
+        self,
+        articles: list[Article],
+        batch_size: int | None = None,
+        concurrency: int = 4,
+    ) -> list[Article]:
+        if not articles:
+            return []
+        # JP-feed summaries are already Japanese; sending them to the API
+        # would only paraphrase. Summarize the rest and merge back below.
+        pending = [a for a in articles if not _JA_RE.search(a.summary)]
+        if len(pending) < len(articles):
+            logger.info(
+                "Skipping %d articles whose summaries are already Japanese",
+                len(articles) - len(pending),
+            )
+        if not pending:
+            return list(articles)
+        # One-or-all: a lone article gets a direct call, no batch prompt
+        # or numbered-response parsing to go wrong.
+        if len(pending) == 1:
+            summarized = [self._summarize_single(pending[0])]
+            return self._merge_summarized(articles, summarized)
+        if batch_size is None:
+            batch_size = self._batch_size
+        logger.info("GeminiSummarizer: summarizing %d articles in Japanese (batch_size=%d)", len(pending), batch_size)
+        batches = [
+            pending[i : i + batch_size]
+            for i in range(0, len(pending), batch_size)
+        ]
+        if len(batches) == 1:
+            summarized = self._summarize_batch(batches[0])
+        else:
+            # Batches are independent and I/O-bound, so overlap the API
+            # calls; _gemini_gate keeps the actual request rate within quota.
+            ordered: list[list[Article]] = [[] for _ in batches]
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as executor:
+                future_to_idx = {
+                    executor.submit(self._summarize_batch, batch): i
+                    for i, batch in enumerate(batches)
+                }
+                for future in as_completed(future_to_idx):
+                    ordered[future_to_idx[future]] = future.result()
+            summarized = [article for batch in ordered for article in batch]
+        return self._merge_summarized(articles, summarized)
+
+    @staticmethod
+    def _merge_summarized(
+        articles: list[Article], summarized: list[Article],
+    ) -> list[Article]:
+        """Re-interleave summarized articles with the skipped Japanese ones.
+
+        ``summarized`` holds results for exactly the articles whose
+        summaries were not Japanese, in their original relative order.
+        """
+        it = iter(summarized)
+        return [
+            a if _JA_RE.search(a.summary) else next(it)
+            for a in articles
+        ]
 
     # ------------------------------------------------------------------
     # Two-stage briefing
@@ -340,73 +691,28 @@ class GeminiSummarizer(Summarizer):
         Returns indices into the *original* articles list.
         """
         # Pre-filter: remove ArXiv papers not relevant to reader's stack.
-        # Keep a mapping from filtered-index → original-index so Gemini's
-        # response can be translated back to the caller's list.
-        original_indices = [
-            i for i, a in enumerate(articles) if _is_relevant_for_reader(a)
-        ]
-        if len(original_indices) < len(articles):
+        # One pass keeps each survivor with its original index, so Gemini's
+        # filtered indices map back with a single list lookup.
+        kept = [(i, a) for i, a in enumerate(articles) if _is_relevant_for_reader(a)]
+        if len(kept) < len(articles):
             logger.info(
                 "Pre-filter: removed %d irrelevant ArXiv articles (%d → %d)",
-                len(articles) - len(original_indices),
+                len(articles) - len(kept),
                 len(articles),
-                len(original_indices),
+                len(kept),
             )
-        if not original_indices:
-            original_indices = list(range(len(articles)))  # Safety fallback
-        filtered = [articles[i] for i in original_indices]
+        if not kept:
+            kept = list(enumerate(articles))  # Safety fallback
 
         article_list = "\n".join(
             f"{i}. [{a.category}] {a.title}: {a.summary}"
-            for i, a in enumerate(filtered)
+            for i, (_, a) in enumerate(kept)
         )
         prompt = (
-            "あなたはデータエンジニア・セキュリティエンジニア兼日本株・米国株の個人投資家向けの"
-            "シニアニュースアナリストです。\n"
-            "以下の記事一覧から、読者にとって本当に重要な記事を**12〜15件**選んでください。\n\n"
-            "## 読者の技術スタック\n"
-            "読者は以下の技術を日常的に使うデータエンジニア・セキュリティエンジニアです。"
-            "これらに関連する記事は優先的に選んでください:\n"
-            "- 言語: TypeScript/Next.js, Python, Go, Rust, Spark\n"
-            "- インフラ: Kubernetes, Docker, Kafka, MySQL, Cassandra, Redis, Hadoop, Athenz\n"
-            "- データ基盤: dbt, Airflow, Databricks, BigQuery, Athena\n"
-            "- AI/LLM: RAG, Vector DB, Embedding, LLMエージェント, Function Calling\n"
-            "- クラウド: AWS, GCP, Azure, Terraform, Cloudflare, GitHub Actions\n\n"
-            "## 必須の選定配分\n"
-            "以下のカテゴリごとに最低限の記事数を確保すること:\n"
-            "- AI・LLM: 2〜3件（モデルリリース、API変更、実用的なRAG/Agent手法を優先。"
-            "理論のみの論文は除外）\n"
-            "- セキュリティ: 2〜4件（実際に悪用されているCVE、重大な脆弱性、攻撃キャンペーンのみ。"
-            "一般論や啓蒙記事は除外）\n"
-            "- マーケット/投資: 2〜3件（具体的数値・指標・決算を含む記事を優先。"
-            "数字のない一般的な経済論評は除外）\n"
-            "- クラウド・DevOps: 1〜2件（AWS/GCP/Azure/CI-CDの具体的サービス更新・障害情報）\n"
-            "- データエンジニアリング: 1〜2件（dbt/Airflow/Spark/BigQuery等の具体的ツール更新・"
-            "アーキテクチャ変更を含む記事）\n"
-            "- テクノロジー全般: 2〜4件（読者スタックに直結する記事を優先）\n"
-            "- 世間の話題: 0〜2件（テック以外でも社会的に大きなニュースがあれば含める。"
-            "政治・経済・災害・国際情勢など、話題として知っておくべきもの）\n\n"
-            "## 選定基準（優先順）\n"
-            "1. **アクション可能か？**: 読者が読んだ後に「何かすべきこと」がある記事を最優先\n"
-            "   （例: パッチ適用、API移行、設定変更、投資判断、ツール導入検討）\n"
-            "2. 具体的な数値・メトリクス・CVE番号・バージョン番号を含む記事\n"
-            "3. 投資判断に直結（マクロ指標の具体数値、決算、セクター動向）\n"
-            "4. 世間で大きな話題になっている出来事（テック以外でも社会的インパクトが大きいもの）\n"
-            "5. 日本語テック記事も選定対象（英語記事と同一トピックの場合は英語版を優先）\n\n"
-            "## 除外基準（以下に該当する記事は選ばない）\n"
-            "- 「〜が発表された」だけで具体的中身がない速報\n"
-            "- 製品の宣伝・マーケティング色が強い記事\n"
-            "- 既に広く知られている事実の繰り返し解説\n"
-            "- 抽象的な「トレンド予測」や「〜が重要になる」系の記事\n"
-            "- チュートリアルや入門記事（読者はシニアエンジニア）\n"
-            "- 似たテーマの記事は最も情報量の多い1件だけ選ぶ\n\n"
-            "## 出力形式\n"
-            "選んだ記事の番号をJSON配列で返してください。それ以外のテキストは不要です。\n"
-            "例: [0, 3, 5, 7, 9, 12, 15, 18]\n\n"
-            f"## 記事一覧（{len(filtered)}件）\n\n"
-            f"{article_list}"
+            _SELECT_PROMPT_HEAD
+            + f"## 記事一覧（{len(kept)}件）\n\n{article_list}"
         )
-        logger.info("Stage 1: selecting important articles from %d candidates", len(filtered))
+        logger.info("Stage 1: selecting important articles from %d candidates", len(kept))
         response = self._call_gemini(prompt, use_pro=True)
         if not response:
             return []
@@ -417,9 +723,9 @@ class GeminiSummarizer(Summarizer):
             if match:
                 indices = json.loads(match.group())
                 valid = [
-                    original_indices[i]
+                    kept[i][0]
                     for i in indices
-                    if 0 <= i < len(filtered)
+                    if 0 <= i < len(kept)
                 ]
                 logger.info("Stage 1: selected %d articles", len(valid))
                 return valid
@@ -468,95 +774,8 @@ class GeminiSummarizer(Summarizer):
 
         # Stage 2: Generate briefing with full context
         prompt = (
-            "あなたはベテランのテックジャーナリストです。データエンジニア・セキュリティエンジニア兼"
-            "個人投資家（日米株）向けのデイリーブリーフィングを日本語で作成してください。\n\n"
-            "## 読者\n"
-            "- 技術スタック: TypeScript/Next.js, Python, Go, Rust, Spark, "
-            "Kubernetes, Docker, Kafka, MySQL, Cassandra, Redis, Hadoop, Athenz, "
-            "dbt, Airflow, Databricks, BigQuery, Athena\n"
-            "- AI/LLM: RAG, Vector DB, LLMエージェント, Function Calling を実務で活用\n"
-            "- クラウド: AWS, GCP, Azure, Terraform, Cloudflare\n"
-            "- 読者のスタックに直結する話題は技術名を挙げて影響を具体的に述べる\n"
-            "- 読者は日米の個別株・ETFに投資している。ニュースの投資インパクトを知りたい\n\n"
-            "## 禁止表現（これらを使ったら書き直す）\n"
-            "- 「〜に注目が集まっています」「〜が重要です」「〜が求められています」\n"
-            "- 「〜の可能性があります」で終わる文\n"
-            "- 「エンジニアは注意が必要です」「対策が急務です」\n"
-            "- 「〜が進んでいます」「〜が加速しています」\n"
-            "- 「今後の動向に注目」「引き続き注視」\n"
-            "- 「〜が期待されます」「〜が見込まれます」（根拠なしの場合）\n"
-            "- 同じ語尾の3連続（「〜した。〜した。〜した。」は不可）\n\n"
-            "## 文体\n"
-            "- 1トピック5〜8行。事実・背景・読者への影響を踏み込んで書く\n"
-            "- 1文は40字以内。長い文は分割する\n"
-            "- 基本構成: 事実(1〜2文) ＋ 技術的背景(1〜2文) ＋ 読者の業務への影響(1〜2文)\n"
-            "- 全トピックの末尾に 📎 [記事タイトル](URL) 必須。例外なし\n"
-            "- 複数の関連記事は1トピックにまとめてよい\n"
-            "- 各バレットポイントには必ず1つ以上の具体的事実（数値、固有名詞、バージョン番号、"
-            "CVE番号など）を含める。具体性のないバレットは書かない\n"
-            "- **悪い例**: 「Kubernetesの新バージョンがリリースされた。新機能が追加されている。」"
-            "（何の新機能か不明。読者が何をすべきかわからない）\n"
-            "- **良い例**: 「Kubernetes v1.32でGateway APIがGA昇格。"
-            "Ingress廃止ロードマップが前進し、v1.30以前のHPA manifestは移行が必要。」"
-            "（バージョン、変更点、影響が明確）\n\n"
-            "## セクション構成\n\n"
-            "### `## 🔥 本日のハイライト`\n"
-            "最重要の3件のみ。各セクションと重複しないこと。\n"
-            "- **太字見出し**（10字前後）\n"
-            "- 事実1文 + 意味1文\n"
-            "- 📎 リンク\n\n"
-            "### `## 🤖 AI・LLM`\n"
-            "AI/ML関連。モデルリリース、API変更、実用的なRAG/Agent/ツール活用法のみ。最大3件。\n"
-            "読者はLLMを実務で使うエンジニア。理論より実装・運用への影響を具体的に述べる。\n"
-            "📎 リンク必須。\n\n"
-            "### `## 🛠️ テクノロジー`\n"
-            "読者の技術スタック（TypeScript, Python, Go, K8s, Kafka等）に直結するトピックのみ。\n"
-            "ハイライトと重複しない別のトピック。最大3件。\n"
-            "具体的なバージョン番号、API変更点、マイグレーション手順があれば明記。\n"
-            "📎 リンク必須。\n\n"
-            "### `## ☁️ クラウド・DevOps`\n"
-            "AWS/GCP/Azure、CI/CD、IaC、CDN関連。該当なしなら省略。最大3件。\n"
-            "サービスのバージョン、料金変更、アーキテクチャ変更の具体値を含める。\n"
-            "📎 リンク必須。\n\n"
-            "### `## 📊 データエンジニアリング`\n"
-            "データ基盤・パイプライン関連。該当なしなら省略。最大3件。\n"
-            "dbt/Airflow/Spark/BigQuery/Databricks等の具体名で影響を述べる。\n"
-            "ツールのバージョン、設定変更点、パフォーマンス改善の具体数値を含める。\n"
-            "📎 リンク必須。\n\n"
-            "### `## 🔒 セキュリティ`\n"
-            "脆弱性・攻撃動向。該当なしなら省略。**最大5件、影響度順**。\n"
-            "各項目に必須: (1)CVE番号（あれば）, (2)影響を受けるソフトウェア・バージョン, "
-            "(3)深刻度（Critical/High/Medium）, (4)具体的対応策（パッチ適用、設定変更等）\n"
-            "類似の脆弱性は1トピックにまとめる。\n"
-            "📎 リンク必須。\n\n"
-            "### `## 🌍 世間の話題`\n"
-            "テック以外で社会的インパクトが大きいニュース。該当なしなら省略。最大2件。\n"
-            "政治・経済政策・国際情勢・災害・社会現象など。\n"
-            "エンジニアや投資家としてどう関係するかを1文添える。\n"
-            "📎 リンク必須。\n\n"
-            "### `## 📈 マーケット`\n"
-            "**記事本文から抽出した具体的数値のみ記載**。以下を可能な限り含む:\n"
-            "- 株価指数（S&P500, NASDAQ, 日経225, TOPIX）の数値と前日比%\n"
-            "- 為替（USD/JPY）の水準\n"
-            "- 米国債利回り（10年）の水準\n"
-            "- 個別銘柄の決算・株価変動（ティッカーシンボル付き）\n"
-            "**記事に数値がない場合は「データ不足：該当記事に具体的数値の記載なし」と正直に書く。**\n"
-            "数値を捏造・推測しないこと。\n"
-            "📎 リンク必須。\n\n"
-            "### `## 🔮 今後の注目`\n"
-            "1〜2週間以内のイベント・予測を2〜3点。**具体的な日付を必ず明記**。\n"
-            "漠然とした予測は書かない。\n\n"
-            "## ルール\n"
-            "- 記事本文を踏まえて書く（RSS概要だけに頼らない）\n"
-            "- 「だから何？」を常に意識。事実の羅列は不可\n"
-            "- 複数記事を横断的に結びつけてトレンドを抽出\n"
-            "- ハイライトの記事は他セクションに書かない（重複厳禁）\n"
-            "- 冒頭挨拶・末尾締め不要。セクションだけ出力\n"
-            "- 記事に書かれていない数値や事実を捏造しない\n"
-            "- 日本語ソースの記事は日本語のまま自然に組み込む\n"
-            "- 日本語と英語で同じトピックの場合、1つにまとめて両方のリンクを付ける\n\n"
-            f"## 厳選記事（{len(selected)}件・本文付き）\n\n"
-            f"{enriched_text}"
+            _BRIEFING_PROMPT_HEAD
+            + f"## 厳選記事（{len(selected)}件・本文付き）\n\n{enriched_text}"
         )
         logger.info("Stage 2: generating briefing with enriched content")
         draft = self._call_gemini(prompt, use_pro=True)
@@ -575,26 +794,7 @@ class GeminiSummarizer(Summarizer):
 
     def _refine_briefing(self, draft: str) -> str:
         """Stage 3: Deepen analysis and improve readability (LLM-only improvements)."""
-        prompt = (
-            "以下のデイリーブリーフィングの原稿を改善してください。\n\n"
-            "## 改善方針（LLMでしかできないことに集中）\n"
-            "1. 浅い分析を深める: 事実の羅列を「だから何？」まで踏み込んだ分析に書き換える\n"
-            "   - 各トピックで「読者（AI/LLMを実務で活用するデータエンジニア・セキュリティエンジニア）の日常業務にどう影響するか」を\n"
-            "     1文追加する\n"
-            "2. 関連トピックの横断: 複数の記事に共通するトレンドがあれば言及する\n"
-            "3. 語尾の単調さ解消: 同じ語尾が3回以上連続していたら変える\n"
-            "4. 1文が40字を超えていたら分割する\n\n"
-            "## 禁止事項\n"
-            "- 情報を追加・捏造しない（原稿にある情報だけで改善）\n"
-            "- セクション構造は変更しない\n"
-            "- リンクの追加・削除はしない\n"
-            "- 以下の表現は使わない: "
-            "「注目が集まっています」「が重要です」「が求められています」「注意が必要です」"
-            "「対策が急務です」「が進んでいます」「が加速しています」「今後の動向に注目」"
-            "「引き続き注視」「が期待されます」「が見込まれます」\n\n"
-            "改善後のブリーフィング全文のみを出力してください。\n\n"
-            f"## 原稿\n\n{draft}"
-        )
+        prompt = _REFINE_PROMPT_HEAD + f"## 原稿\n\n{draft}"
         logger.info("Stage 3: refining briefing (deepening analysis)")
         refined = self._call_gemini(prompt, use_pro=True)
         return refined or draft
@@ -619,6 +819,12 @@ class GeminiSummarizer(Summarizer):
         "が見込まれます",
     ]
 
+    # One alternation sweeps all banned phrases in a single pass. List
+    # order is preserved so longer phrases win over their prefixes
+    # (e.g. 注目が集まっています before 注目が集まって), matching the old
+    # sequential replace order.
+    _BANNED_RE = re.compile("|".join(re.escape(p) for p in _BANNED_PHRASES))
+
     @staticmethod
     def _section_has_link(section_text: str) -> bool:
         """Check if a section contains at least one 📎 markdown link."""
@@ -674,10 +880,10 @@ class GeminiSummarizer(Summarizer):
         processed = "".join(result_parts)
 
         # Remove banned phrases from text (sentence-level cleanup)
-        for phrase in self._BANNED_PHRASES:
-            if phrase in processed:
-                processed = processed.replace(phrase, "")
-                banned_found.append(f"'{phrase}'")
+        matches = self._BANNED_RE.findall(processed)
+        if matches:
+            processed = self._BANNED_RE.sub("", processed)
+            banned_found = [f"'{p}'" for p in dict.fromkeys(matches)]
         if banned_found:
             logger.info(
                 "Post-process: removed banned phrases: %s",
@@ -739,9 +945,15 @@ def _cluster_articles(
         if ra != rb:
             parent[ra] = rb
 
+    # Hoist keyword extraction out of the pairwise loop: each title is
+    # tokenized once into a bitmask, and the O(N^2) comparisons below are
+    # integer AND/OR plus popcounts.
+    vocab: dict[str, int] = {}
+    masks = [keyword_bitmask(a.title, vocab) for a in articles]
+
     for i in range(n):
         for j in range(i + 1, n):
-            jaccard, overlap = keyword_similarity(articles[i].title, articles[j].title)
+            jaccard, overlap = bitmask_similarity(masks[i], masks[j])
             if jaccard >= sim_threshold and overlap >= 2:
                 union(i, j)
 
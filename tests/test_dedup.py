@@ -1,9 +1,7 @@
 """Tests for deduplication module."""
 
 import json
-import tempfile
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 
 from src.dedup import Deduplicator, normalize_url
 from src.parser import Article
@@ -26,6 +24,12 @@ def _make_article(
     )
 
 
+def _empty_db(tmp_path):
+    db_path = tmp_path / "seen_articles.json"
+    db_path.write_text("{}", encoding="utf-8")
+    return db_path
+
+
 class TestNormalizeUrl:
     def test_removes_utm_params(self):
         url = "https://example.com/article?utm_source=twitter&utm_medium=social"
@@ -50,12 +54,8 @@ class TestNormalizeUrl:
 
 
 class TestDeduplicator:
-    def test_filters_duplicate_urls(self):
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            json.dump({}, f)
-            db_path = f.name
-
-        dedup = Deduplicator(db_path=db_path)
+    def test_filters_duplicate_urls(self, tmp_path):
+        dedup = Deduplicator(db_path=_empty_db(tmp_path))
         articles = [
             _make_article(title="Article 1", link="https://example.com/1", article_id="1"),
             _make_article(title="Article 2", link="https://example.com/1", article_id="2"),
@@ -64,12 +64,8 @@ class TestDeduplicator:
         assert len(result) == 1
         assert result[0].title == "Article 1"
 
-    def test_filters_similar_titles(self):
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            json.dump({}, f)
-            db_path = f.name
-
-        dedup = Deduplicator(db_path=db_path)
+    def test_filters_similar_titles(self, tmp_path):
+        dedup = Deduplicator(db_path=_empty_db(tmp_path))
         articles = [
             _make_article(title="Breaking: Stock Market Crashes Today", link="https://a.com/1"),
             _make_article(title="Breaking: Stock Market Crashes Today!", link="https://b.com/2"),
@@ -77,12 +73,8 @@ class TestDeduplicator:
         result = dedup.filter_new(articles)
         assert len(result) == 1
 
-    def test_allows_different_articles(self):
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            json.dump({}, f)
-            db_path = f.name
-
-        dedup = Deduplicator(db_path=db_path)
+    def test_allows_different_articles(self, tmp_path):
+        dedup = Deduplicator(db_path=_empty_db(tmp_path))
         articles = [
             _make_article(title="Python 4.0 Released", link="https://a.com/1"),
             _make_article(title="Rust 2.0 Announced", link="https://b.com/2"),
@@ -90,10 +82,8 @@ class TestDeduplicator:
         result = dedup.filter_new(articles)
         assert len(result) == 2
 
-    def test_persistence(self):
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            json.dump({}, f)
-            db_path = f.name
+    def test_persistence(self, tmp_path):
+        db_path = _empty_db(tmp_path)
 
         # First run
         dedup1 = Deduplicator(db_path=db_path)
@@ -106,25 +96,23 @@ class TestDeduplicator:
         result = dedup2.filter_new(articles)
         assert len(result) == 0
 
-    def test_prune_old_entries(self):
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            old_date = (datetime.now(timezone.utc) - timedelta(days=10)).isoformat()
-            json.dump({
+    def test_prune_old_entries(self, tmp_path):
+        db_path = tmp_path / "seen_articles.json"
+        old_date = (datetime.now(timezone.utc) - timedelta(days=10)).isoformat()
+        db_path.write_text(
+            json.dumps({
                 "//example.com/old": {"title": "Old", "seen_at": old_date},
-            }, f)
-            db_path = f.name
+            }),
+            encoding="utf-8",
+        )
 
         dedup = Deduplicator(db_path=db_path)
         dedup.prune(window_days=7)
         assert len(dedup._seen) == 0
 
-    def test_cross_source_keyword_dedup(self):
+    def test_cross_source_keyword_dedup(self, tmp_path):
         """Same news story reported by different sources with different wording."""
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            json.dump({}, f)
-            db_path = f.name
-
-        dedup = Deduplicator(db_path=db_path)
+        dedup = Deduplicator(db_path=_empty_db(tmp_path))
         articles = [
             _make_article(
                 title="Breaking: Critical CVE-2025-1234 Vulnerability Found in Apache Kafka",
@@ -138,13 +126,9 @@ class TestDeduplicator:
         result = dedup.filter_new(articles)
         assert len(result) == 1
 
-    def test_different_topics_not_merged(self):
+    def test_different_topics_not_merged(self, tmp_path):
         """Articles about different topics should not be deduped."""
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            json.dump({}, f)
-            db_path = f.name
-
-        dedup = Deduplicator(db_path=db_path)
+        dedup = Deduplicator(db_path=_empty_db(tmp_path))
         articles = [
             _make_article(
                 title="Google Releases New Kubernetes Security Patch v1.30",
@@ -158,13 +142,9 @@ class TestDeduplicator:
         result = dedup.filter_new(articles)
         assert len(result) == 2
 
-    def test_normalized_title_similarity(self):
+    def test_normalized_title_similarity(self, tmp_path):
         """Titles that differ only in prefix/suffix noise should be deduped."""
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            json.dump({}, f)
-            db_path = f.name
-
-        dedup = Deduplicator(db_path=db_path)
+        dedup = Deduplicator(db_path=_empty_db(tmp_path))
         articles = [
             _make_article(
                 title="Python 3.14 Released with Major Performance Improvements",
@@ -178,10 +158,9 @@ class TestDeduplicator:
         result = dedup.filter_new(articles)
         assert len(result) == 1
 
-    def test_corrupted_db_starts_fresh(self):
-        with tempfile.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
-            f.write("not valid json{{{")
-            db_path = f.name
+    def test_corrupted_db_starts_fresh(self, tmp_path):
+        db_path = tmp_path / "seen_articles.json"
+        db_path.write_text("not valid json{{{", encoding="utf-8")
 
         dedup = Deduplicator(db_path=db_path)
         assert dedup._seen == {}
@@ -2,12 +2,35 @@
 
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
-from time import mktime
 
-from src.parser import Article, _strip_html, _parse_date, fetch_articles
+from src.parser import (
+    Article,
+    _strip_html,
+    _parse_date,
+    fetch_articles,
+    fetch_all_articles,
+)
 from src.feeds import FeedSource
 
 
+class _FakeEntry:
+    """Minimal stand-in for a feedparser entry: dict-style get + date attrs.
+
+    Much cheaper than a MagicMock per entry, and it cannot silently absorb
+    attribute typos the way a mock would.
+    """
+
+    __slots__ = ("_data", "published_parsed", "updated_parsed")
+
+    def __init__(self, data=None, published_parsed=None, updated_parsed=None):
+        self._data = data or {}
+        self.published_parsed = published_parsed
+        self.updated_parsed = updated_parsed
+
+    def get(self, key, default=""):
+        return self._data.get(key, default)
+
+
 class TestStripHtml:
     def test_removes_tags(self):
         assert _strip_html("<p>Hello <b>world</b></p>") == "Hello world"
@@ -18,24 +41,24 @@ class TestStripHtml:
     def test_collapses_whitespace(self):
         assert _strip_html("  hello   world  ") == "hello world"
 
+    def test_collapses_entity_encoded_whitespace(self):
+        assert _strip_html("Line one&#10;&#10;line two") == "Line one line two"
+        assert _strip_html("a&nbsp;&nbsp;b") == "a b"
+
     def test_empty_string(self):
         assert _strip_html("") == ""
 
 
 class TestParseDate:
     def test_with_published_parsed(self):
-        entry = MagicMock()
-        entry.published_parsed = (2025, 1, 15, 10, 30, 0, 2, 15, 0)
-        entry.updated_parsed = None
+        entry = _FakeEntry(published_parsed=(2025, 1, 15, 10, 30, 0, 2, 15, 0))
         result = _parse_date(entry)
         assert result.year == 2025
         assert result.month == 1
         assert result.day == 15
 
     def test_fallback_to_now(self):
-        entry = MagicMock()
-        entry.published_parsed = None
-        entry.updated_parsed = None
+        entry = _FakeEntry()
         result = _parse_date(entry)
         assert isinstance(result, datetime)
 
@@ -51,19 +74,19 @@ class TestFetchArticles:
 
     @patch("src.parser.feedparser.parse")
     def test_successful_fetch(self, mock_parse):
-        mock_entry = MagicMock()
-        mock_entry.get = lambda key, default="": {
-            "title": "Test Article",
-            "link": "https://example.com/article",
-            "summary": "A summary",
-            "id": "article-1",
-        }.get(key, default)
-        mock_entry.published_parsed = (2025, 1, 15, 10, 0, 0, 2, 15, 0)
-        mock_entry.updated_parsed = None
+        entry = _FakeEntry(
+            {
+                "title": "Test Article",
+                "link": "https://example.com/article",
+                "summary": "A summary",
+                "id": "article-1",
+            },
+            published_parsed=(2025, 1, 15, 10, 0, 0, 2, 15, 0),
+        )
 
         mock_parse.return_value = MagicMock(
             bozo=False,
-            entries=[mock_entry],
+            entries=[entry],
         )
 
         source = self._make_source()
@@ -95,18 +118,18 @@ class TestFetchArticles:
 
     @patch("src.parser.feedparser.parse")
     def test_respects_max_articles(self, mock_parse):
-        entries = []
-        for i in range(20):
-            entry = MagicMock()
-            entry.get = lambda key, default="", idx=i: {
-                "title": f"Article {idx}",
-                "link": f"https://example.com/{idx}",
-                "summary": "Summary",
-                "id": f"id-{idx}",
-            }.get(key, default)
-            entry.published_parsed = (2025, 1, 15, 10, 0, 0, 2, 15, 0)
-            entry.updated_parsed = None
-            entries.append(entry)
+        entries = [
+            _FakeEntry(
+                {
+                    "title": f"Article {i}",
+                    "link": f"https://example.com/{i}",
+                    "summary": "Summary",
+                    "id": f"id-{i}",
+                },
+                published_parsed=(2025, 1, 15, 10, 0, 0, 2, 15, 0),
+            )
+            for i in range(20)
+        ]
 
         mock_parse.return_value = MagicMock(bozo=False, entries=entries)
         source = self._make_source()
@@ -120,28 +143,24 @@ class TestFetchArticles:
         old_time = now - timedelta(hours=72)
         fresh_time = now - timedelta(hours=1)
 
-        old_tt = old_time.timetuple()
-        fresh_tt = fresh_time.timetuple()
-
-        old_entry = MagicMock()
-        old_entry.get = lambda key, default="": {
-            "title": "Old Article",
-            "link": "https://example.com/old",
-            "summary": "Old summary",
-            "id": "old-1",
-        }.get(key, default)
-        old_entry.published_parsed = old_tt
-        old_entry.updated_parsed = None
-
-        fresh_entry = MagicMock()
-        fresh_entry.get = lambda key, default="": {
-            "title": "Fresh Article",
-            "link": "https://example.com/fresh",
-            "summary": "Fresh summary",
-            "id": "fresh-1",
-        }.get(key, default)
-        fresh_entry.published_parsed = fresh_tt
-        fresh_entry.updated_parsed = None
+        old_entry = _FakeEntry(
+            {
+                "title": "Old Article",
+                "link": "https://example.com/old",
+                "summary": "Old summary",
+                "id": "old-1",
+            },
+            published_parsed=old_time.timetuple(),
+        )
+        fresh_entry = _FakeEntry(
+            {
+                "title": "Fresh Article",
+                "link": "https://example.com/fresh",
+                "summary": "Fresh summary",
+                "id": "fresh-1",
+            },
+            published_parsed=fresh_time.timetuple(),
+        )
 
         mock_parse.return_value = MagicMock(
             bozo=False,
@@ -154,22 +173,34 @@ class TestFetchArticles:
         assert len(articles) == 1
         assert articles[0].title == "Fresh Article"
 
+    @patch("src.parser._save_http_cache")
+    @patch("src.parser._load_http_cache", return_value={})
+    @patch("src.parser.feedparser.parse")
+    def test_304_feed_not_counted_as_failed(self, mock_parse, _load, _save):
+        """A 304 (unchanged) feed yields no articles but is not a failure."""
+        mock_parse.return_value = MagicMock(status=304, bozo=False, entries=[])
+
+        source = self._make_source()
+        articles, feed_stats = fetch_all_articles([source])
+
+        assert articles == []
+        assert feed_stats["Test Feed"] is True
+
     @patch("src.parser.feedparser.parse")
     def test_no_max_age_keeps_all(self, mock_parse):
         """Without max_age_hours, all articles are kept."""
         now = datetime.now(timezone.utc)
         old_time = now - timedelta(hours=72)
-        old_tt = old_time.timetuple()
-
-        entry = MagicMock()
-        entry.get = lambda key, default="": {
-            "title": "Old Article",
-            "link": "https://example.com/old",
-            "summary": "Old summary",
-            "id": "old-1",
-        }.get(key, default)
-        entry.published_parsed = old_tt
-        entry.updated_parsed = None
+
+        entry = _FakeEntry(
+            {
+                "title": "Old Article",
+                "link": "https://example.com/old",
+                "summary": "Old summary",
+                "id": "old-1",
+            },
+            published_parsed=old_time.timetuple(),
+        )
 
         mock_parse.return_value = MagicMock(
             bozo=False,
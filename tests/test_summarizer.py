@@ -382,5 +382,132 @@ class TestArticleExtractorNesting(unittest.TestCase):
         self.assertNotIn("tracking", text)
 
 
+# --- Japanese-skip path in summarize() -------------------------------
+
+
+class TestSummarizeJapaneseSkip(unittest.TestCase):
+    """Tests for skipping already-Japanese summaries and merging back."""
+
+    def setUp(self):
+        self.summarizer = GeminiSummarizer(api_key="test-key")
+
+    @patch.object(
+        GeminiSummarizer, "_call_gemini", return_value="1. 和訳一\n2. 和訳二"
+    )
+    def test_skipped_article_keeps_summary_and_position(self, mock_call):
+        articles = [
+            _make_article(title="First", link="https://example.com/1"),
+            _make_article(
+                title="Second",
+                link="https://example.com/2",
+                summary="日本語の要約です。",
+            ),
+            _make_article(title="Third", link="https://example.com/3"),
+        ]
+        result = self.summarizer.summarize(articles)
+
+        self.assertEqual(
+            [a.summary for a in result], ["和訳一", "日本語の要約です。", "和訳二"]
+        )
+        self.assertEqual([a.title for a in result], ["First", "Second", "Third"])
+
+    @patch.object(GeminiSummarizer, "_call_gemini")
+    def test_all_japanese_skips_api_entirely(self, mock_call):
+        articles = [
+            _make_article(link="https://example.com/1", summary="要約その一。"),
+            _make_article(link="https://example.com/2", summary="要約その二。"),
+        ]
+        result = self.summarizer.summarize(articles)
+
+        mock_call.assert_not_called()
+        self.assertEqual(result, articles)
+
+    @patch.object(GeminiSummarizer, "_call_gemini", return_value="単独の和訳")
+    def test_single_pending_uses_direct_call(self, mock_call):
+        """A lone non-Japanese article takes the single-article path."""
+        articles = [
+            _make_article(link="https://example.com/1", summary="既存の要約。"),
+            _make_article(title="Lone English", link="https://example.com/2"),
+        ]
+        result = self.summarizer.summarize(articles)
+
+        # The single path sends one plain (non-numbered) prompt
+        self.assertEqual(mock_call.call_count, 1)
+        self.assertEqual(
+            [a.summary for a in result], ["既存の要約。", "単独の和訳"]
+        )
+
+    @patch.object(GeminiSummarizer, "_call_gemini", return_value="1. 片方だけ")
+    def test_batch_fallback_preserves_skipped_articles(self, mock_call):
+        """A mismatched batch response falls back per-article; the skipped
+        Japanese article still comes through untouched and in place."""
+        articles = [
+            _make_article(title="First", link="https://example.com/1"),
+            _make_article(
+                title="Second",
+                link="https://example.com/2",
+                summary="日本語の要約です。",
+            ),
+            _make_article(title="Third", link="https://example.com/3"),
+        ]
+        result = self.summarizer.summarize(articles)
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result[1].summary, "日本語の要約です。")
+        self.assertEqual([a.title for a in result], ["First", "Second", "Third"])
+
+
+# --- Adaptive batch sizing -------------------------------------------
+
+
+class TestAdaptiveBatchSize(unittest.TestCase):
+    """Tests for the AIMD batch-size adjustment in _summarize_batch."""
+
+    def setUp(self):
+        self.summarizer = GeminiSummarizer(api_key="test-key")
+        self.batch = [
+            _make_article(title="First", link="https://example.com/1"),
+            _make_article(title="Second", link="https://example.com/2"),
+        ]
+
+    @patch.object(GeminiSummarizer, "_call_gemini", return_value="1. 一\n2. 二")
+    def test_clean_parse_grows_by_one(self, mock_call):
+        self.summarizer._summarize_batch(self.batch)
+        self.assertEqual(
+            self.summarizer._batch_size, GeminiSummarizer._BATCH_SIZE_START + 1
+        )
+
+    @patch.object(GeminiSummarizer, "_call_gemini", return_value="1. 一つだけ")
+    def test_parse_mismatch_halves(self, mock_call):
+        self.summarizer._summarize_batch(self.batch)
+        self.assertEqual(
+            self.summarizer._batch_size, GeminiSummarizer._BATCH_SIZE_START // 2
+        )
+
+    @patch.object(GeminiSummarizer, "_call_gemini", return_value="1. 一\n2. 二")
+    def test_growth_capped_at_max(self, mock_call):
+        self.summarizer._batch_size = GeminiSummarizer._BATCH_SIZE_MAX
+        self.summarizer._summarize_batch(self.batch)
+        self.assertEqual(
+            self.summarizer._batch_size, GeminiSummarizer._BATCH_SIZE_MAX
+        )
+
+    @patch.object(GeminiSummarizer, "_call_gemini", return_value="1. 一つだけ")
+    def test_shrink_clamped_at_min(self, mock_call):
+        self.summarizer._batch_size = GeminiSummarizer._BATCH_SIZE_MIN
+        self.summarizer._summarize_batch(self.batch)
+        self.assertEqual(
+            self.summarizer._batch_size, GeminiSummarizer._BATCH_SIZE_MIN
+        )
+
+    @patch.object(GeminiSummarizer, "_call_gemini", return_value=None)
+    def test_no_response_leaves_size_unchanged(self, mock_call):
+        """HTTP failures say nothing about parse quality, so no adjustment."""
+        self.summarizer._summarize_batch(self.batch)
+        self.assertEqual(
+            self.summarizer._batch_size, GeminiSummarizer._BATCH_SIZE_START
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
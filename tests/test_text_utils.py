@@ -1,6 +1,12 @@
 """Tests for text_utils module."""
 
-from src.text_utils import normalize_title, extract_keywords, keyword_similarity
+from src.text_utils import (
+    normalize_title,
+    extract_keywords,
+    keyword_similarity,
+    keyword_bitmask,
+    bitmask_similarity,
+)
 
 
 class TestNormalizeTitle:
@@ -114,3 +120,46 @@ class TestKeywordSimilarity:
         )
         assert 0.0 < score < 1.0
         assert overlap >= 2
+
+
+class TestKeywordBitmask:
+    def test_matches_set_based_similarity(self):
+        titles = (
+            "Google releases new Kubernetes security patch",
+            "Google announces Kubernetes performance improvements",
+        )
+        vocab: dict[str, int] = {}
+        mask_a = keyword_bitmask(titles[0], vocab)
+        mask_b = keyword_bitmask(titles[1], vocab)
+        assert bitmask_similarity(mask_a, mask_b) == keyword_similarity(*titles)
+
+    def test_identical_titles_give_full_similarity(self):
+        vocab: dict[str, int] = {}
+        mask_a = keyword_bitmask("Python 3.13 Released with New Features", vocab)
+        mask_b = keyword_bitmask("Python 3.13 Released with New Features", vocab)
+        score, overlap = bitmask_similarity(mask_a, mask_b)
+        assert score == 1.0
+        assert overlap == len(extract_keywords("Python 3.13 Released with New Features"))
+
+    def test_vocab_grows_only_for_new_words(self):
+        vocab: dict[str, int] = {}
+        keyword_bitmask("Google releases Kubernetes patch", vocab)
+        size_after_first = len(vocab)
+        # Re-encoding the same title adds no new vocabulary entries
+        keyword_bitmask("Google releases Kubernetes patch", vocab)
+        assert len(vocab) == size_after_first
+        keyword_bitmask("Google announces Gemini update", vocab)
+        assert len(vocab) > size_after_first
+
+    def test_empty_title_gives_zero_mask(self):
+        vocab: dict[str, int] = {}
+        mask = keyword_bitmask("", vocab)
+        other = keyword_bitmask("Some Title Here", vocab)
+        assert mask == 0
+        assert bitmask_similarity(mask, other) == (0.0, 0)
+
+    def test_disjoint_masks(self):
+        vocab: dict[str, int] = {}
+        mask_a = keyword_bitmask("Python 4.0 Released Today", vocab)
+        mask_b = keyword_bitmask("Stock Market Crashes Hard", vocab)
+        assert bitmask_similarity(mask_a, mask_b) == (0.0, 0)